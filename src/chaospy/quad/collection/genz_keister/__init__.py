@@ -8,10 +8,10 @@ Licensing
 This code is distributed under the GNU LGPL license.
 """
 
-from .gk16 import quad_genz_keister_16
-from .gk18 import quad_genz_keister_18
-from .gk22 import quad_genz_keister_22
-from .gk24 import quad_genz_keister_24
+from .gk16 import quad_genz_keister_16, GENZ_KEISTER_16_NESTING
+from .gk18 import quad_genz_keister_18, GENZ_KEISTER_18_NESTING
+from .gk22 import quad_genz_keister_22, GENZ_KEISTER_22_NESTING
+from .gk24 import quad_genz_keister_24, GENZ_KEISTER_24_NESTING
 
 COLLECTION = {
     16: quad_genz_keister_16,
@@ -20,4 +20,13 @@ COLLECTION = {
     24: quad_genz_keister_24,
 }
 
+# For each rule and order, the positions of the abscissas within the
+# abscissas of the highest order, for reusing evaluations across orders.
+NESTING = {
+    16: GENZ_KEISTER_16_NESTING,
+    18: GENZ_KEISTER_18_NESTING,
+    22: GENZ_KEISTER_22_NESTING,
+    24: GENZ_KEISTER_24_NESTING,
+}
+
 from .genz_keister import quad_genz_keister
@@ -1,18 +1,36 @@
 """
 Frontend for the Hermite Genz-Keister quadrature rule.
 """
+import functools
 
 import numpy as np
-import scipy.special
 
 import chaospy.quad
 
 
-def quad_genz_keister(order, dist, rule=24):
+def quad_genz_keister(order, dist, rule=24, dtype=float):
     """
     Genz-Keister quadrature rule.
 
-    Eabsicassample:
+    Args:
+        order (int, array_like) : The quadrature order. If array, one order
+            per dimension.
+        dist (Dist) : The distribution to create quadrature over.
+        rule (int) : The Genz-Keister rule to use. Either 16, 18, 22 or 24.
+            Direct calls default to 24. If None, as passed by
+            ``generate_quadrature``, the 16 rule is used, valid up to order 8,
+            as listed for ``Genz``/``Z`` in
+            :mod:`chaospy.quad.collection.frontend`.
+        dtype (numpy.dtype) : The data type of the returned abscissas and
+            weights. The rules are constructed in double precision, and
+            converted before assembling the product rule. Single precision
+            halves the memory traffic for large product rules, at the cost of
+            about 1e-7 relative accuracy. Defaults to double if None.
+
+    Returns:
+        (numpy.ndarray, numpy.ndarray) : Abscissas and weights.
+
+    Example:
         >>> abscissas, weights = quad_genz_keister(
         ...         order=1, dist=chaospy.Uniform(0, 1))
         >>> print(numpy.around(abscissas, 4))
@@ -20,31 +38,152 @@ def quad_genz_keister(order, dist, rule=24):
         >>> print(numpy.around(weights, 4))
         [0.1667 0.6667 0.1667]
     """
-    assert isinstance(rule, int)
+    if rule is None:
+        rule = 16
+    if dtype is None:
+        dtype = float
+    if rule not in chaospy.quad.genz_keister.COLLECTION:
+        raise ValueError(
+            "Genz-Keister rule %s not recognised; choose from %s" % (
+                rule, sorted(chaospy.quad.genz_keister.COLLECTION)))
 
-    if len(dist) > 1:
+    dists = list(dist) if len(dist) > 1 else [dist]
+    orders = np.ones(len(dists), dtype=int)*order
+    values = _marginal_rules(orders, dists, rule)
+    if len(values) == 1:
+        # no product to assemble for a single dimension
+        abscissas, weights = values[0]
+        return (abscissas.astype(dtype, copy=False)[np.newaxis],
+                weights.astype(dtype, copy=False))
+    return _product_rule(values, dtype)
 
-        if isinstance(order, int):
-            values = [quad_genz_keister(order, d, rule) for d in dist]
-        else:
-            values = [quad_genz_keister(order[i], dist[i], rule)
-                      for i in range(len(dist))]
 
-        abscissas = [_[0][0] for _ in values]
-        abscissas = chaospy.quad.combine(abscissas).T
-        weights = [_[1] for _ in values]
-        weights = np.prod(chaospy.quad.combine(weights), -1)
+def _product_rule(values, dtype):
+    """
+    Tensor product of univariate rules.
+
+    Args:
+        values (list) : Abscissas and weights for each marginal.
+        dtype (numpy.dtype) : The data type of the returned arrays.
 
-        return abscissas, weights
+    Returns:
+        (numpy.ndarray, numpy.ndarray) : Abscissas with shape ``(dim, size)``
+        and weights with shape ``(size,)``.
 
-    foo = chaospy.quad.genz_keister.COLLECTION[rule]
-    abscissas, weights = foo(order)
-    abscissas = dist.inv(scipy.special.ndtr(abscissas))
-    abscissas = abscissas.reshape(1, abscissas.size)
+    Example:
+        >>> abscissas, weights = _product_rule([
+        ...     (numpy.array([1., 2.]), numpy.array([.5, .5])),
+        ...     (numpy.array([3., 4., 5.]), numpy.array([.2, .6, .2]))], float)
+        >>> print(abscissas)
+        [[1. 1. 1. 2. 2. 2.]
+         [3. 4. 5. 3. 4. 5.]]
+        >>> print(weights)
+        [0.1 0.3 0.1 0.1 0.3 0.1]
+    """
+    # same limit as `chaospy.quad.combine`, checked in floating point so high
+    # dimensions can not overflow
+    size = np.prod([len(_[1]) for _ in values], dtype=float)
+    if size*(len(values)+1) > 10**9:
+        raise MemoryError("Too large sets")
+
+    abscissas = [_[0].astype(dtype, copy=False) for _ in values]
+    # stack the grid views directly into a C-contiguous (dim, size) array
+    abscissas = np.stack(np.meshgrid(
+        *abscissas, indexing="ij", copy=False)).reshape(len(values), -1)
+    weights = [_[1].astype(dtype, copy=False) for _ in values]
+    # the outer product is contiguous, so raveling it does not copy
+    weights = functools.reduce(np.multiply.outer, weights).ravel()
 
     return abscissas, weights
 
 
+def _marginal_rules(orders, dists, rule):
+    """
+    Univariate rules with the abscissas mapped onto each marginal.
+
+    Identical marginals, like in `Iid`, are only constructed once. Normal
+    marginals are mapped in closed form. The remaining are mapped through
+    their inverse CDF, with the normal CDF for all of them evaluated in a
+    single call when there are more than one.
+
+    Args:
+        orders (array_like) : The quadrature order of each marginal.
+        dists (Sequence) : The univariate marginal distributions.
+        rule (int) : The Genz-Keister rule to use.
+
+    Returns:
+        (list) : Abscissas and weights for each marginal.
+    """
+    foo = chaospy.quad.genz_keister.COLLECTION[rule]
+    rules = {}
+    pending = []
+    for order, dist in zip(orders, dists):
+        key = (order, id(dist))
+        if key in rules:
+            continue
+
+        # abscissas are only read, so the shared table is used without copying
+        abscissas, weights = foo(order, copy=False)
+        parameters = _normal_parameters(dist)
+        if parameters is None:
+            pending.append((key, dist, abscissas))
+        else:
+            # the rules are tabulated for standard normal, so the map is affine
+            loc, scale = parameters
+            abscissas = loc+scale*abscissas
+        rules[key] = abscissas, weights.copy()
+
+    if pending:
+        from scipy.special import ndtr
+        if len(pending) == 1:
+            uloc = [ndtr(pending[0][2])]
+        else:
+            uloc = ndtr(np.concatenate([_[2] for _ in pending]))
+            sizes = np.cumsum([len(_[2]) for _ in pending])[:-1]
+            uloc = np.split(uloc, sizes)
+        for (key, dist, _), uloc_ in zip(pending, uloc):
+            rules[key] = dist.inv(uloc_), rules[key][1]
+
+    return [rules[order, id(dist)] for order, dist in zip(orders, dists)]
+
+
+def _normal_parameters(dist):
+    """
+    Location and scale of a normal distribution.
+
+    Recognizes the standard normal, and the standard normal shifted and
+    scaled by constants, which is how ``chaospy.Normal`` is constructed.
+
+    Args:
+        dist (Dist) : Univariate distribution to inspect.
+
+    Returns:
+        (float, float, None) : Location and scale, or None if ``dist`` is not
+        recognized as a normal distribution.
+
+    Example:
+        >>> print(_normal_parameters(chaospy.Normal(2, 3)))
+        (2.0, 3.0)
+        >>> print(_normal_parameters(chaospy.Uniform(0, 1)))
+        None
+    """
+    loc, scale = 0., 1.
+    operators = chaospy.distributions.operators
+    if isinstance(dist, operators.addition.Add):
+        dist, loc = dist.prm["left"], dist.prm["right"]
+        if not isinstance(loc, np.ndarray) or loc.size != 1:
+            return None
+    if isinstance(dist, operators.multiply.Mul):
+        dist, scale = dist.prm["left"], dist.prm["right"]
+        if not isinstance(scale, np.ndarray) or scale.size != 1:
+            return None
+    if not isinstance(dist, chaospy.distributions.cores.normal):
+        return None
+    # normal distributions are symmetric, so a negative scale gives the same
+    # distribution, and taking the absolute value keeps the abscissas sorted
+    return float(loc), abs(float(scale))
+
+
 if __name__ == "__main__":
     import doctest
     doctest.testmod()
@@ -0,0 +1,137 @@
+"""
+Preprocessing of the raw Genz-Keister tables.
+
+The raw tables are stored as they appear in Burkardt's implementation:
+abscissas with respect to the weight function ``exp(-x**2)`` and weights that
+are not normalized. As all the rules are symmetric around zero, only the
+non-negative abscissas and their weights are stored, starting with the center
+node. As the rules are fixed, the mirroring and the conversion to the
+standard normal scale is done once when the module is imported, instead of
+on every call.
+
+The lower order rules are shared between the different Genz-Keister rules.
+These are converted only once, and share the same arrays.
+"""
+import math
+
+import numpy
+
+# Converted rules, keyed by the raw table entry.
+TABULATED = {}
+
+
+def tabulate(table):
+    """
+    Convert raw Genz-Keister table to standard normal abscissas and weights.
+
+    Args:
+        table (dict) : Mapping from number of nodes to raw non-negative
+            abscissas and their weights.
+
+    Returns:
+        (tuple) : Abscissas and weights for each quadrature order, that is
+        sorted by number of nodes, with abscissas scaled by ``sqrt(2)`` and
+        weights normalized to sum to one.
+        The arrays are read-only, as they are shared between calls. Copy
+        them before modifying.
+
+    Example:
+        >>> abscissas, weights = tabulate({3: ((0., 1.), (4., 1.))})[0]
+        >>> print(numpy.around(abscissas, 4))
+        [-1.4142  0.      1.4142]
+        >>> print(numpy.around(weights, 4))
+        [0.1667 0.6667 0.1667]
+    """
+    out = []
+    for size in sorted(table):
+        rule = table[size]
+        if rule not in TABULATED:
+            abscissas, weights = rule
+            abscissas = numpy.array(abscissas, dtype=float)
+            weights = numpy.array(weights, dtype=float)
+            abscissas = numpy.concatenate([-abscissas[:0:-1], abscissas])
+            weights = numpy.concatenate([weights[:0:-1], weights])
+            abscissas *= numpy.sqrt(2)
+            # compensated sum, as the weights span many orders of magnitude
+            weights /= math.fsum(weights)
+            abscissas.flags.writeable = False
+            weights.flags.writeable = False
+            TABULATED[rule] = abscissas, weights
+        out.append(TABULATED[rule])
+    return tuple(out)
+
+
+def nest(tabulated):
+    """
+    Locate the abscissas of each level within the highest level.
+
+    The Genz-Keister rules are nested, so function evaluations at the
+    abscissas of the highest level can be reused for all lower levels.
+
+    Args:
+        tabulated (tuple) : Abscissas and weights for each level, as returned
+            by :func:`tabulate`.
+
+    Returns:
+        (tuple) : Index array for each level, such that ``top[indices]`` are
+        the abscissas of that level, where ``top`` are the abscissas of the
+        highest level.
+
+    Example:
+        >>> tabulated = tabulate({
+        ...     1: ((0.,), (1.,)), 3: ((0., 1.), (4., 1.)),
+        ...     5: ((0., 1., 2.), (6., 4., 1.))})
+        >>> for indices in nest(tabulated):
+        ...     print(indices)
+        [2]
+        [1 2 3]
+        [0 1 2 3 4]
+    """
+    top = tabulated[-1][0]
+    out = []
+    for abscissas, _ in tabulated:
+        indices = numpy.argmin(numpy.abs(abscissas[:, numpy.newaxis]-top), -1)
+        assert numpy.allclose(top[indices], abscissas)
+        indices.flags.writeable = False
+        out.append(indices)
+    return tuple(out)
+
+
+def lookup(tabulated, order, copy=True, dtype=float):
+    """
+    Look up the abscissas and weights of one level of a tabulated rule.
+
+    Args:
+        tabulated (tuple) : Abscissas and weights for each level, as returned
+            by :func:`tabulate`.
+        order (int) : The quadrature order, that is the index of the level.
+        copy (bool) : If false, and `dtype` is double precision, return the
+            tabulated arrays directly, without copying. These are read-only
+            C-contiguous float arrays, shared between calls.
+        dtype (numpy.dtype) : The data type of the returned arrays. Single
+            precision halves the memory footprint for large product grids, at
+            the cost of about 1e-7 relative accuracy.
+
+    Returns:
+        (numpy.ndarray, numpy.ndarray) : Abscissas and weights.
+
+    Example:
+        >>> tabulated = tabulate({1: ((0.,), (1.,)), 3: ((0., 1.), (4., 1.))})
+        >>> abscissas, weights = lookup(tabulated, 1, dtype=numpy.float32)
+        >>> print(abscissas.dtype, abscissas.flags.writeable)
+        float32 True
+        >>> lookup(tabulated, 2)
+        Traceback (most recent call last):
+            ...
+        ValueError: Genz-Keister rule only defined for order 0 to 1, got 2
+    """
+    if not 0 <= order < len(tabulated):
+        raise ValueError(
+            "Genz-Keister rule only defined for order 0 to %d, got %s"
+            % (len(tabulated)-1, order))
+
+    abscissas, weights = tabulated[order]
+    # copies by default, as callers like `sparse_grid` modify the weights
+    # in-place
+    return (abscissas.astype(dtype, copy=copy),
+            weights.astype(dtype, copy=copy))
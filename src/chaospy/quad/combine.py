@@ -47,24 +47,25 @@ def combine(args, part=None):
         raise MemoryError("Too large sets")
 
     if len(args) == 1:
-        out = args[0]
+        return args[0]
+
+    length = int(numpy.prod([len(arg) for arg in args]))
+    width = sum(arg.shape[1] for arg in args)
+    out = numpy.empty((length, width))
+    if not length:
+        return out
+
+    # Fill in the columns of each argument through a view of the output,
+    # where each row is repeated for all combinations of the following
+    # arguments, and the whole block for all combinations of the preceding.
+    outer, column = 1, 0
+    for arg in args:
+        inner = length//(outer*len(arg))
+        view = out.reshape(outer, len(arg), inner, width)
+        view[:, :, :, column:column+arg.shape[1]] = arg[:, numpy.newaxis]
+        outer *= len(arg)
+        column += arg.shape[1]
 
-    elif len(args) == 2:
-        out = combine_two(*args)
-
-    else:
-        arg1 = combine_two(*args[:2])
-        out = combine([arg1,]+args[2:])
-
-    return out
-
-
-def combine_two(arg1, arg2):
-    l1, d1 = arg1.shape
-    l2, d2 = arg2.shape
-    out = numpy.empty((l1*l2, d1+d2))
-    out[:,:d1] = numpy.tile(arg1, l2).reshape(l1*l2, d1)
-    out[:,d1:] = numpy.tile(arg2.T, l1).reshape(d2, l1*l2).T
     return out
 
 
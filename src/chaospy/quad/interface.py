@@ -1,7 +1,4 @@
-import inspect
-
 import numpy as np
-from scipy.misc import comb
 
 from . import collection, sparse_grid
 
@@ -0,0 +1,145 @@
+import pytest
+import numpy as np
+from numpy.polynomial import hermite_e
+from scipy.special import factorial
+
+import chaospy as cp
+from chaospy.quad.collection import genz_keister
+from chaospy.quad.collection.genz_keister import gk16, gk18, gk22, gk24
+
+GENZ_KEISTER_TABLES = {
+    16: gk16.GENZ_KEISTER_16,
+    18: gk18.GENZ_KEISTER_18,
+    22: gk22.GENZ_KEISTER_22,
+    24: gk24.GENZ_KEISTER_24,
+}
+
+
+def test_genz_keister_tables():
+    for table in GENZ_KEISTER_TABLES.values():
+        for size, (abscissas, weights) in table.items():
+            abscissas, weights = np.array(abscissas), np.array(weights)
+            assert abscissas.shape == weights.shape == ((size+1)//2,)
+            assert abscissas[0] == 0
+            assert np.all(np.diff(abscissas) > 0)
+
+
+def test_genz_keister_tabulated():
+    for quad_function in genz_keister.COLLECTION.values():
+        abscissas, weights = quad_function(2, copy=False)
+        for array in (abscissas, weights):
+            assert array.dtype == np.float64
+            assert array.flags.c_contiguous
+            assert not array.flags.writeable
+        assert np.isclose(np.sum(weights), 1)
+        abscissas, weights = quad_function(2)
+        assert abscissas.flags.writeable and weights.flags.writeable
+
+
+def test_genz_keister_symmetry():
+    for rule, table in GENZ_KEISTER_TABLES.items():
+        for order in range(len(table)):
+            abscissas, weights = genz_keister.COLLECTION[rule](order)
+            assert np.all(np.diff(abscissas) > 0)
+            assert np.all(abscissas == -abscissas[::-1])
+            assert np.all(weights == weights[::-1])
+
+
+def test_genz_keister_order_validation():
+    for rule, table in GENZ_KEISTER_TABLES.items():
+        quad_function = genz_keister.COLLECTION[rule]
+        abscissas, _ = quad_function(len(table)-1)
+        assert len(abscissas) == max(table)
+        for order in (-1, len(table)):
+            with pytest.raises(ValueError):
+                quad_function(order)
+
+
+def test_genz_keister_exactness():
+    for rule, table in GENZ_KEISTER_TABLES.items():
+        for order in range(len(table)):
+            abscissas, weights = genz_keister.COLLECTION[rule](order)
+            # symmetric interpolatory rules are exact up to the number of
+            # nodes, checked with normalized probabilists' Hermite polynomials
+            for degree in range(len(abscissas)+1):
+                coefficients = np.zeros(degree+1)
+                coefficients[degree] = 1
+                value = np.sum(weights*hermite_e.hermeval(
+                    abscissas, coefficients))/np.sqrt(factorial(degree))
+                assert np.isclose(value, degree == 0, atol=1e-12)
+
+
+def test_genz_keister_single_precision():
+    for quad_function in genz_keister.COLLECTION.values():
+        abscissas, weights = quad_function(3, dtype=np.float32)
+        assert abscissas.dtype == weights.dtype == np.float32
+        reference = quad_function(3)
+        assert np.allclose(abscissas, reference[0], rtol=1e-6)
+        assert np.allclose(weights, reference[1], rtol=1e-6)
+
+
+def test_genz_keister_rule():
+    dist = cp.Iid(cp.Normal(), 2)
+    abscissas, weights = cp.generate_quadrature(2, dist, rule="Z")
+    assert abscissas.shape == (2, 49)
+    assert np.isclose(np.sum(weights), 1)
+    abscissas, weights = cp.generate_quadrature(8, cp.Normal(), rule="Z")
+    assert abscissas.shape == (1, 35)
+    with pytest.raises(ValueError):
+        cp.generate_quadrature(9, cp.Normal(), rule="Z")
+    with pytest.raises(ValueError):
+        cp.quad_genz_keister(2, dist, rule=20)
+
+
+def test_genz_keister_normal():
+    reference, _ = genz_keister.quad_genz_keister_24(4)
+    abscissas, weights = cp.quad_genz_keister(4, cp.Normal())
+    assert np.allclose(abscissas, reference)
+    assert np.isclose(np.sum(weights*abscissas**2), 1)
+    abscissas, weights = cp.quad_genz_keister(4, cp.Normal(2, 3))
+    assert np.allclose(abscissas, 2+3*reference)
+
+
+def test_genz_keister_nesting():
+    for rule, quad_function in genz_keister.COLLECTION.items():
+        nesting = genz_keister.NESTING[rule]
+        top, _ = quad_function(len(nesting)-1)
+        values = np.cos(top)
+        for order, indices in enumerate(nesting):
+            abscissas, weights = quad_function(order)
+            assert np.allclose(top[indices], abscissas)
+            assert np.isclose(np.sum(weights*values[indices]),
+                              np.sum(weights*np.cos(abscissas)))
+
+
+def test_genz_keister_single_precision_product():
+    dist = cp.J(cp.Normal(1, 2), cp.Uniform(), cp.Normal())
+    abscissas, weights = cp.quad_genz_keister(3, dist, dtype=np.float32)
+    assert abscissas.dtype == weights.dtype == np.float32
+    reference = cp.quad_genz_keister(3, dist)
+    assert np.allclose(abscissas, reference[0], rtol=1e-6)
+    assert np.allclose(weights, reference[1], rtol=1e-5)
+
+
+def test_genz_keister_product_layout():
+    dist = cp.J(cp.Normal(), cp.Uniform(), cp.Normal(1, 2))
+    abscissas, weights = cp.quad_genz_keister([1, 2, 3], dist)
+    assert abscissas.shape == (3, 3*9*19)
+    assert abscissas.flags.c_contiguous
+    assert weights.shape == (3*9*19,)
+
+
+def test_genz_keister_too_large():
+    with pytest.raises(MemoryError):
+        cp.quad_genz_keister(4, cp.Iid(cp.Normal(), 6))
+
+
+def test_genz_keister_vector_order():
+    dist = cp.J(cp.Normal(), cp.Uniform())
+    abscissas, weights = cp.quad_genz_keister([1, 2], dist)
+    abscissas0, weights0 = cp.quad_genz_keister(1, cp.Normal())
+    abscissas1, weights1 = cp.quad_genz_keister(2, cp.Uniform())
+    assert abscissas.shape == (2, 3*9)
+    assert np.allclose(abscissas[0], np.repeat(abscissas0[0], 9))
+    assert np.allclose(abscissas[1], np.tile(abscissas1[0], 3))
+    assert np.allclose(weights, np.outer(weights0, weights1).ravel())